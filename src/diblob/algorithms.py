@@ -1,14 +1,21 @@
-import random
+import heapq
 from abc import ABC, abstractmethod
 
+from diblob.exceptions import NegativeCostCycleException
+
 
 class DFSTemplate(ABC):
     """
     Abstract class for DFS. Used for DFS algorithms modifications.
     """
+
+    __slots__ = ('visit_time', 'visited_nodes', 'visited', 'visitation_dict',
+                 'digraph_manager', 'nodes_to_visit')
+
     def __init__(self, digraph_manager):
         self.visit_time = 0
         self.visited_nodes = []
+        self.visited = set()
         self.visitation_dict = {}
         self.digraph_manager = digraph_manager
         self.nodes_to_visit = list(digraph_manager.nodes)
@@ -16,20 +23,16 @@ class DFSTemplate(ABC):
 
     def exec(self, node_id: str):
         """
-        Executes DFS starting with node_id.
+        Executes DFS starting with node_id. Remaining components are started in
+        digraph node order.
         Args:
             - node_id (str): id ot the node where computation is started.
         """
-        self.nodes_to_visit.remove(node_id)
-
-        random.shuffle(self.nodes_to_visit)
-        self.nodes_to_visit = [node_id] + self.nodes_to_visit
+        for start_node_id in [node_id] + self.nodes_to_visit:
+            if start_node_id not in self.visited:
+                self.run(start_node_id)
 
-        while self.nodes_to_visit:
-            self.run(node_id)
-
-            if self.nodes_to_visit:
-                node_id = self.nodes_to_visit[0]
+        self.nodes_to_visit = []
 
     @abstractmethod
     def run(self, node_id: str):
@@ -40,56 +43,251 @@ class DFSTemplate(ABC):
 
 class DFS(DFSTemplate):
     """
-    Basic DFS.
+    Basic DFS. Runs on an explicit stack with enter/exit sentinels, so deep digraphs
+    do not hit the interpreter recursion limit.
     """
+
+    __slots__ = ()
+
     def run(self, node_id: str):
         """
         Basic DFS runner.
         """
-        self.visited_nodes.append(node_id)
-        self.nodes_to_visit.remove(node_id)
-        self.visitation_dict[node_id] = {"visitation_time": self.visit_time}
+        visited = self.visited
+        visited_nodes = self.visited_nodes
+        visitation_dict = self.visitation_dict
+        digraph_manager = self.digraph_manager
+
+        stack = [(node_id, False)]
 
-        for outgoing_node_id in self.digraph_manager[node_id].outgoing_nodes:
-            if outgoing_node_id not in self.visited_nodes:
-                self.run(outgoing_node_id)
+        while stack:
+            node_id, exit_visit = stack.pop()
 
+            if exit_visit:
+                self._post_visit(node_id)
+                continue
+
+            if node_id in visited:
+                continue
+
+            visited.add(node_id)
+            visited_nodes.append(node_id)
+            visitation_dict[node_id] = {"visitation_time": self.visit_time}
+            stack.append((node_id, True))
+
+            for outgoing_node_id in reversed(digraph_manager[node_id].outgoing_nodes):
+                if outgoing_node_id not in visited:
+                    stack.append((outgoing_node_id, False))
+
+
+    def _post_visit(self, node_id: str):
+        """
+        Bookkeeping executed when DFS leaves the node (post-order).
+        """
         self.visit_time += 1
-        self.visitation_dict[node_id] |=  {"return_time": self.visit_time}
+        self.visitation_dict[node_id]["return_time"] = self.visit_time
 
 
 class DFSA(DFS):
     """
     DFS modification enables compute time of nodes visitation.
     """
+
+    __slots__ = ('node_idx', 'nodes_order_dict')
+
     def __init__(self, digraph_manager):
         super().__init__(digraph_manager)
         self.node_idx = len(self.digraph_manager.nodes)
         self.nodes_order_dict = {}
 
 
-    @staticmethod
-    def ordering_decorator(dfs_proc_func):
+    def _post_visit(self, node_id: str):
+        """
+        Extends post-order bookkeeping with reverse post-order node numbering.
+        """
+        super()._post_visit(node_id)
+        self.node_idx -= 1
+        self.nodes_order_dict[self.node_idx] = node_id
+
+
+class DFS_with_path(DFS):
+    """
+    DFS modification which tracks the traversal tree path from the starting node to
+    every visited node. Paths are reconstructed on demand from predecessor pointers
+    instead of being copied on every visit.
+    """
+
+    __slots__ = ('predecessors',)
+
+    def __init__(self, digraph_manager):
+        super().__init__(digraph_manager)
+        self.predecessors = {}
+
+
+    def run(self, node_id: str):
         """
-        Decorator for runner enables visitation time computation.
+        DFS runner which additionally records the predecessor of every visited node.
         """
-        def wrapper(self, node_id):
-            result = dfs_proc_func(self, node_id)
-            self.node_idx -= 1
-            self.nodes_order_dict[self.node_idx] = node_id
-            return result
-        return wrapper
+        visited = self.visited
+        visited_nodes = self.visited_nodes
+        visitation_dict = self.visitation_dict
+        predecessors = self.predecessors
+        digraph_manager = self.digraph_manager
+
+        stack = [(node_id, None, False)]
+
+        while stack:
+            node_id, predecessor_id, exit_visit = stack.pop()
+
+            if exit_visit:
+                self._post_visit(node_id)
+                continue
+
+            if node_id in visited:
+                continue
+
+            visited.add(node_id)
+            visited_nodes.append(node_id)
+            predecessors[node_id] = predecessor_id
+            visitation_dict[node_id] = {"visitation_time": self.visit_time}
+            stack.append((node_id, None, True))
+
+            for outgoing_node_id in reversed(digraph_manager[node_id].outgoing_nodes):
+                if outgoing_node_id not in visited:
+                    stack.append((outgoing_node_id, node_id, False))
+
+
+    def get_path(self, node_id: str):
+        """
+        Returns list of node_ids from the root of the traversal tree to node_id.
+        """
+        path = []
+
+        while node_id is not None:
+            path.append(node_id)
+            node_id = self.predecessors[node_id]
+
+        return path[::-1]
+
+
+class TarjanSSC:
+    """
+    Tarjan algorithm computing strongly connected components of the digraph.
+    Uses an explicit work stack with a saved neighbour iterator per frame instead of
+    recursion, so deep components neither hit the recursion limit nor pay the
+    interpreter call overhead per visited node.
+    """
+
+    __slots__ = ('digraph_manager',)
+
+    def __init__(self, digraph_manager):
+        self.digraph_manager = digraph_manager
+
+
+    def run(self):
+        """
+        Returns list of sets of node_ids, where every set is a strongly connected
+        component of the digraph.
+        """
+        digraph_manager = self.digraph_manager
+        indices = {}
+        low_links = {}
+        on_stack = set()
+        stack = []
+        sccs = []
+        index_counter = 0
+
+        for start_node_id in self.digraph_manager.nodes:
+
+            if start_node_id in indices:
+                continue
+
+            indices[start_node_id] = low_links[start_node_id] = index_counter
+            index_counter += 1
+            stack.append(start_node_id)
+            on_stack.add(start_node_id)
+            work = [(start_node_id,
+                     iter(digraph_manager[start_node_id].outgoing_nodes))]
+
+            while work:
+                node_id, outgoing_iter = work[-1]
+
+                try:
+                    outgoing_node_id = next(outgoing_iter)
 
+                    if outgoing_node_id not in indices:
+                        indices[outgoing_node_id] = low_links[outgoing_node_id] = index_counter
+                        index_counter += 1
+                        stack.append(outgoing_node_id)
+                        on_stack.add(outgoing_node_id)
+                        work.append((outgoing_node_id,
+                                     iter(digraph_manager[outgoing_node_id].outgoing_nodes)))
 
-    @ordering_decorator
-    def run(self, node_id):
-        super().run(node_id)
+                    elif outgoing_node_id in on_stack:
+                        low_links[node_id] = min(low_links[node_id], indices[outgoing_node_id])
+
+                except StopIteration:
+                    work.pop()
+
+                    if low_links[node_id] == indices[node_id]:
+                        scc = set()
+
+                        while True:
+                            scc_node_id = stack.pop()
+                            on_stack.remove(scc_node_id)
+                            scc.add(scc_node_id)
+
+                            if scc_node_id == node_id:
+                                break
+
+                        sccs.append(scc)
+
+                    if work:
+                        parent_id = work[-1][0]
+                        low_links[parent_id] = min(low_links[parent_id], low_links[node_id])
+
+        return sccs
+
+
+def is_strongly_connected(digraph_manager):
+    """
+    Checks strong connectivity of the digraph in O(V + E) with two reachability
+    passes (along outgoing and incoming edges) instead of computing least cost
+    paths between all pairs of nodes. Returns False as soon as one of the passes
+    misses a node.
+    """
+    nodes = digraph_manager.nodes
+
+    if not nodes:
+        return True
+
+    start_node_id = next(iter(nodes))
+
+    for direction in ('outgoing_nodes', 'incoming_nodes'):
+        visited = {start_node_id}
+        stack = [start_node_id]
+
+        while stack:
+            node_id = stack.pop()
+
+            for neigh_id in getattr(digraph_manager[node_id], direction):
+                if neigh_id not in visited:
+                    visited.add(neigh_id)
+                    stack.append(neigh_id)
+
+        if len(visited) != len(nodes):
+            return False
+
+    return True
 
 
 class DijkstraAlgorithm:
     """
     Dijkstra Algorithm
     """
+
+    __slots__ = ('digraph_manager',)
+
     def __init__(self, digraph_manager):
         self.digraph_manager = digraph_manager
 
@@ -99,34 +297,145 @@ class DijkstraAlgorithm:
         Dijkstra algorithm runner. 
         Args:
             - node_id (str): starting node id.
-            - cost_function (dict): enable edge weighting.
+            - cost_function (dict): enable edge weighting (unit costs when omitted).
         """
-        if cost_function is None:
-            cost_function = {edge_id : 1 for edge_id in self.digraph_manager.edges}
-
-        nodes = sorted(list(self.digraph_manager.nodes))
+        unit_cost = cost_function is None
 
         min_distance_dict = {dest_node_id: {"distance": float('inf') if dest_node_id != node_id\
                                                                      else 0,
-                                            "min_path": []} for dest_node_id in nodes}
+                                            "min_path": []} for dest_node_id in
+                                                                self.digraph_manager.nodes}
+        digraph_manager = self.digraph_manager
+        heappop, heappush = heapq.heappop, heapq.heappush
 
-        while nodes:
+        predecessors = {}
+        heap = [(0, node_id)]
 
-            min_node_id = min(nodes, key=lambda dest_node_id:
-                              min_distance_dict[dest_node_id]["distance"])
+        while heap:
 
-            v = min_distance_dict[min_node_id]
-            min_distance = v["distance"]
-            nodes.remove(min_node_id)
+            min_distance, min_node_id = heappop(heap)
 
-            for neigh_id in set(self.digraph_manager[min_node_id].outgoing_nodes) & set(nodes):
+            if min_distance > min_distance_dict[min_node_id]["distance"]:
+                continue
+
+            for neigh_id in digraph_manager[min_node_id].outgoing_nodes:
 
                 u = min_distance_dict[neigh_id]
-                edge_id = (min_node_id, neigh_id)
-                potential_new_min_distance = min_distance + cost_function[edge_id]
+                potential_new_min_distance = min_distance +\
+                    (1 if unit_cost else cost_function[(min_node_id, neigh_id)])
 
                 if u["distance"] > potential_new_min_distance:
                     u["distance"] = potential_new_min_distance
-                    u["min_path"] = v["min_path"] + [edge_id]
+                    predecessors[neigh_id] = min_node_id
+                    heappush(heap, (potential_new_min_distance, neigh_id))
+
+        for dest_node_id in predecessors:
+            min_path = []
+            current_node_id = dest_node_id
+
+            while current_node_id != node_id:
+                prev_node_id = predecessors[current_node_id]
+                min_path.append((prev_node_id, current_node_id))
+                current_node_id = prev_node_id
+
+            min_path.reverse()
+            min_distance_dict[dest_node_id]["min_path"] = min_path
 
         return min_distance_dict
+
+
+class FloydWarshall:
+    """
+    Floyd-Warshall algorithm computing least cost paths between every pair of nodes.
+    Works on a dense cost matrix indexed by node position instead of a dict keyed
+    by (tail, head) tuples, so the O(V^3) inner loop does list indexing instead of
+    tuple hashing.
+    """
+
+    __slots__ = ('digraph_manager', 'nodes', 'node_index', 'cost_matrix', 'successor_matrix')
+
+    def __init__(self, digraph_manager):
+        self.digraph_manager = digraph_manager
+        self.nodes = []
+        self.node_index = {}
+        self.cost_matrix = []
+        self.successor_matrix = []
+
+
+    def run(self, cost_function: dict = None):
+        """
+        Floyd-Warshall runner.
+        Args:
+            - cost_function (dict): enable edge weighting (unit costs when omitted).
+        Returns dict {(tail_id, head_id): least cost} for every pair of nodes.
+        """
+        self.nodes = list(self.digraph_manager.nodes)
+        self.node_index = {dest_node_id: idx for idx, dest_node_id in enumerate(self.nodes)}
+
+        number_of_nodes = len(self.nodes)
+        inf = float('inf')
+
+        self.cost_matrix = [[inf] * number_of_nodes for _ in range(number_of_nodes)]
+        self.successor_matrix = [[None] * number_of_nodes for _ in range(number_of_nodes)]
+
+        for idx in range(number_of_nodes):
+            self.cost_matrix[idx][idx] = 0
+            self.successor_matrix[idx][idx] = idx
+
+        for edge_id in self.digraph_manager.edges:
+            tail_idx = self.node_index[edge_id[0]]
+            head_idx = self.node_index[edge_id[1]]
+            edge_cost = 1 if cost_function is None else cost_function[edge_id]
+
+            if edge_cost < self.cost_matrix[tail_idx][head_idx]:
+                self.cost_matrix[tail_idx][head_idx] = edge_cost
+                self.successor_matrix[tail_idx][head_idx] = head_idx
+
+        for k in range(number_of_nodes):
+            cost_row_k = self.cost_matrix[k]
+
+            for i in range(number_of_nodes):
+                cost_row_i = self.cost_matrix[i]
+                cost_ik = cost_row_i[k]
+
+                if cost_ik == inf:
+                    continue
+
+                successor_row_i = self.successor_matrix[i]
+                successor_ik = successor_row_i[k]
+
+                for j in range(number_of_nodes):
+                    new_cost = cost_ik + cost_row_k[j]
+
+                    if new_cost < cost_row_i[j]:
+                        cost_row_i[j] = new_cost
+                        successor_row_i[j] = successor_ik
+
+                if cost_row_i[i] < 0:
+                    raise NegativeCostCycleException(f"Digraph contains negative cost cycle\
+                                                      through node {self.nodes[i]}!")
+
+        return {(tail_id, head_id): self.cost_matrix[tail_idx][head_idx]
+                for tail_idx, tail_id in enumerate(self.nodes)
+                for head_idx, head_id in enumerate(self.nodes)}
+
+
+    def get_min_path(self, tail_node_id: str, head_node_id: str):
+        """
+        Reconstructs least cost path computed by run as list of edge_ids
+        (empty list if head is not reachable from tail).
+        """
+        tail_idx = self.node_index[tail_node_id]
+        head_idx = self.node_index[head_node_id]
+
+        if self.successor_matrix[tail_idx][head_idx] is None:
+            return []
+
+        min_path = []
+
+        while tail_idx != head_idx:
+            next_idx = self.successor_matrix[tail_idx][head_idx]
+            min_path.append((self.nodes[tail_idx], self.nodes[next_idx]))
+            tail_idx = next_idx
+
+        return min_path
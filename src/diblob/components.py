@@ -18,6 +18,8 @@ class Node:
     Note: {incoming}/{outgoing}_nodes can be redundant (pseudograph enabled).
     """
 
+    __slots__ = ('node_id', 'diblob_id', 'incoming_nodes', 'outgoing_nodes')
+
     def __init__(self,
                  node_id: str,
                  diblob_id: str,
@@ -97,6 +99,8 @@ class Edge:
              A -> B with edge [A, B, C, D].
     """
 
+    __slots__ = ('path',)
+
     def __init__(self, path: list[str]):
 
         if len(path) < 2:
@@ -131,8 +135,11 @@ class Diblob:
         diblob_id (str): unique id of the diblob.
         children (set): set of diblob_ids which is the subgraphs of the considered graph.
         nodes (list[str]): list of node_ids which are located in the diblob.
-        parent_id (str): id of the diblob in which the considered diblob is contained. 
+        parent_id (str): id of the diblob in which the considered diblob is contained.
     """
+
+    __slots__ = ('diblob_id', 'parent_id', 'children', 'nodes')
+
     def __init__(self,
                  diblob_id: str,
                  children: set,
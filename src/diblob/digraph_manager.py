@@ -78,7 +78,7 @@ class DigraphManager:
 
     def __setitem__(self, key: str | tuple[str, str], value: Diblob | Node | Edge) -> None:
 
-        if key in set(self.diblobs) | set(self.nodes):
+        if key in self.diblobs or key in self.nodes:
             raise CollisionException('Key should be unique over diblobs | nodes | edges')
 
         if isinstance(value, Diblob) and isinstance(key, str):
@@ -102,11 +102,18 @@ class DigraphManager:
 
 
     def __getitem__(self, key: str | tuple[str, str]):
-        return (self.diblobs | self.nodes | self.edges)[key]
+
+        if key in self.nodes:
+            return self.nodes[key]
+
+        if key in self.diblobs:
+            return self.diblobs[key]
+
+        return self.edges[key]
 
 
     def __contains__(self, key: str | tuple[str, str]):
-        return key in set(self.diblobs | self.nodes | self.edges)
+        return key in self.nodes or key in self.diblobs or key in self.edges
 
 
     def __call__(self, diblob_id: str):
@@ -241,10 +248,12 @@ class DigraphManager:
         incoming_edges = set()
         outgoing_edges = set()
 
+        node_diblob_ids = {node_id: node.diblob_id for node_id, node in self.nodes.items()}
+
         for edge_id in self.edges:
 
-            tail_diblob_id = self[edge_id[0]].diblob_id
-            head_diblob_id = self[edge_id[1]].diblob_id
+            tail_diblob_id = node_diblob_ids[edge_id[0]]
+            head_diblob_id = node_diblob_ids[edge_id[1]]
 
             if tail_diblob_id in descendants_with_diblob_id and\
                head_diblob_id in descendants_with_diblob_id:
@@ -592,6 +601,7 @@ class DigraphManager:
         """
 
         edge_dict = dict(self.edges)
+        edges_to_connect = []
 
         for edge_id, edge_lst in edge_dict.items():
             if len(edge_lst) > 1:
@@ -604,7 +614,9 @@ class DigraphManager:
                     self.remove_edges(edge)
                     decouple_node_id = f"dec{idx + 1}({tail},{head})"
                     self.add_nodes(decouple_node_id, diblob_id=diblob_id)
-                    self.connect_nodes((tail, decouple_node_id), (decouple_node_id, head))
+                    edges_to_connect += [(tail, decouple_node_id), (decouple_node_id, head)]
+
+        self.connect_nodes(*edges_to_connect)
 
 
     def reverse_edges(self, *edges: tuple[Edge, ...]):
@@ -612,10 +624,14 @@ class DigraphManager:
         reverse delivered edges (not edge_id because of pseudograph properties).
         """
 
+        edges_to_connect = []
+
         for edge in edges:
             tail, head = edge.get_tail_and_head()
             self.remove_edges(edge)
-            self.connect_nodes((head, tail))
+            edges_to_connect.append((head, tail))
+
+        self.connect_nodes(*edges_to_connect)
 
 
     def sorted(self):
@@ -96,3 +96,8 @@ class RenamingException(Exception):
     """
     Raised when an component id try to be changed into occupied id.
     """
+
+class NegativeCostCycleException(Exception):
+    """
+    Raised when least cost paths computation detects negative cost cycle in the digraph.
+    """
@@ -106,11 +106,17 @@ class RandomSCC(RandomBase):
         if not cycle_sizes:
             raise RandomCycleException("cycle_sizes cannot be empty!")
 
-        random_cycle = RandomCycle(node_space, cycle_sizes[0], random_diblob_id)
-        for c_size in cycle_sizes[1:]:
-            random_cycle = random_cycle + RandomCycle(node_space, c_size, random_diblob_id)
+        merged_cycle_dict = {}
 
-        super().__init__(random_cycle)
+        for c_size in cycle_sizes:
+            random_cycle = RandomCycle(node_space, c_size, random_diblob_id)
+            cycle_dict = dict(random_cycle.digraph_manager(random_diblob_id))[random_diblob_id]
+
+            for node_id, outgoing_nodes in cycle_dict.items():
+                merged_cycle_dict[node_id] = list(set(merged_cycle_dict.get(node_id, []) +
+                                                      outgoing_nodes))
+
+        super().__init__(DigraphManager({random_diblob_id: merged_cycle_dict}))
 
 
 class RandomDAG(RandomBase):
@@ -136,7 +142,6 @@ class RandomDAG(RandomBase):
 
         node_indexes = [(tail_idx, head_idx) for tail_idx in range(node_space_size)
                         for head_idx in range(tail_idx, node_space_size) if tail_idx < head_idx]
-        print(len(node_indexes), number_of_edges)
         node_indexes = random.sample(node_indexes, k=number_of_edges)
 
         digraph_manager.connect_nodes(*[(node_space_order[tail_idx], node_space_order[head_idx])
@@ -36,6 +36,10 @@ def cut_outgoing_edges(digraph_manager, diblob_id: str):
 
     outgoing_nodes = {node for node, _ in outgoing_edges}
 
+    outgoing_heads = {}
+    for tail, head in outgoing_edges:
+        outgoing_heads.setdefault(tail, []).append(head)
+
 
     def get_diblob_path(node_id: str):
         diblob = digraph_manager[digraph_manager[node_id].diblob_id]
@@ -55,7 +59,7 @@ def cut_outgoing_edges(digraph_manager, diblob_id: str):
     for node in outgoing_nodes:
         neighs = eval(f"diblob_dict{str(get_diblob_path(node)).replace(', ', '][')}['{node}']")
 
-        filtered_outgoing_nodes = [edge[1] for edge in outgoing_edges if edge[0] == node]
+        filtered_outgoing_nodes = outgoing_heads[node]
         elements_to_remove = [{key: sorted(value)}
                                 for key, value in list_groupby(
                                 filtered_outgoing_nodes, {node: digraph_manager[node].diblob_id